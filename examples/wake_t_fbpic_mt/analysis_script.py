@@ -2,11 +2,13 @@
 Contains the function that analyzes the simulation results,
 after the simulation was run.
 """
+import os
+
 import numpy as np
 
 
 def analyze_simulation(simulation_directory, output_params):
-    a_x_abs = np.loadtxt('a_x_abs.txt')
-    output_params['f'] = a_x_abs
+    a_x_abs = np.load(os.path.join(simulation_directory, 'a_x_abs.npy'))
+    output_params['f'] = float(a_x_abs)
 
     return output_params
@@ -56,7 +56,7 @@ def run_wake_t(bunch, g_lens):
     a_x, b_x, g_x = twiss_parameters(bunch.x, bunch.px, bunch.pz, w=bunch.q)
 
     # Save parameter to file for `analysis_script.py`.
-    np.savetxt('a_x_abs.txt', np.array([np.abs(a_x)]))
+    np.save('a_x_abs', np.abs(a_x))
 
 
 def run_fbpic(bunch, g_lens):
@@ -224,7 +224,7 @@ def run_fbpic(bunch, g_lens):
     a_x, b_x, g_x = twiss_parameters(x, px, pz, w=q)
 
     # Save parameter to file for `analysis_script.py`.
-    np.savetxt('a_x_abs.txt', np.array([np.abs(a_x)]))
+    np.save('a_x_abs', np.abs(a_x))
 
 
 if __name__ == '__main__':
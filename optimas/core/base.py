@@ -12,6 +12,8 @@ class NamedBase():
     name : str
         The name to assign.
     """
+    __slots__ = ('_name',)
+
     def __init__(
         self,
         name: str
@@ -17,6 +17,8 @@ class Parameter(NamedBase):
     dtype : np.dtype
         The data type of the parameter.
     """
+    __slots__ = ('_dtype',)
+
     def __init__(
         self,
         name: str,
@@ -50,6 +52,11 @@ class VaryingParameter(Parameter):
         Default value of the parameter when it is not being varied. Only needed
         for some generators.
     """
+    __slots__ = (
+        '_lower_bound', '_upper_bound', '_is_fidelity',
+        '_fidelity_target_value', '_default_value'
+    )
+
     def __init__(
         self,
         name: str,
@@ -101,6 +108,8 @@ class TrialParameter(Parameter):
     dtype : np.dtype
         The data type of the parameter.
     """
+    __slots__ = ('_save_name',)
+
     def __init__(
         self,
         name: str,
@@ -126,6 +135,8 @@ class Objective(Parameter):
         Indicates whether the objective should be minimized or,
         otherwise, maximized. By default, ``True``.
     """
+    __slots__ = ('_minimize',)
+
     def __init__(
         self,
         name: Optional[str] = 'f',
@@ -15,6 +15,8 @@ class Task(NamedBase):
     n_opt : int
         Number of task evaluations to perform per optimization batch.
     """
+    __slots__ = ('_n_init', '_n_opt')
+
     def __init__(
         self,
         name: str,
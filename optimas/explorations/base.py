@@ -159,7 +159,8 @@ class Exploration():
                 # Load array.
                 history = np.load(history)
                 # Only include runs that completed
-                history = history[history['sim_ended']]
+                if not history['sim_ended'].all():
+                    history = history[history['sim_ended']]
             else:
                 raise ValueError(
                     'History file {} does not exist.'.format(history))
@@ -31,10 +31,10 @@ def persistent_generator(H, persis_info, gen_specs, libE_info):
         else:
             resources.set_env_to_gpus('CUDA_VISIBLE_DEVICES')
 
-    # Get generator, objectives, and parameters to analyze.
+    # Get generator and the parameters (objectives and analyzed) to evaluate.
     generator = gen_specs['user']['generator']
-    objectives = generator.objectives
-    analyzed_parameters = generator.analyzed_parameters
+    evaluated_parameters = (
+        generator.objectives + generator.analyzed_parameters)
 
     ps = PersistentSupport(libE_info, EVAL_GEN_TAG)
 
@@ -81,7 +81,7 @@ def persistent_generator(H, persis_info, gen_specs, libE_info):
             for i in range(n):
                 trial_index = int(calc_in['trial_index'][i])
                 trial = generator._trials[trial_index]
-                for par in objectives + analyzed_parameters:
+                for par in evaluated_parameters:
                     y = calc_in[par.name][i]
                     ev = Evaluation(parameter=par, value=y)
                     trial.complete_evaluation(ev)
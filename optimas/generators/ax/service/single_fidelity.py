@@ -9,7 +9,7 @@ from ax.modelbridge.generation_strategy import (
 from ax.modelbridge.registry import Models
 from ax.service.utils.instantiation import ObjectiveProperties
 
-from optimas.core import Objective, VaryingParameter, Parameter
+from optimas.core import Objective, Trial, VaryingParameter, Parameter
 from .base import AxServiceGenerator
 
 
@@ -47,6 +47,11 @@ class AxSingleFidelityGenerator(AxServiceGenerator):
     model_history_dir : str, optional
         Name of the directory in which the model will be saved. By default,
         ``'model_history'``.
+    torch_dtype : torch.dtype, optional
+        The data type used by the Gaussian process model. By default
+        (``None``), ``torch.float`` is used when running on a CUDA GPU
+        (which also enables TF32 matrix multiplications) and ``torch.double``
+        otherwise.
     """
     def __init__(
         self,
@@ -60,7 +65,9 @@ class AxSingleFidelityGenerator(AxServiceGenerator):
         save_model: Optional[bool] = True,
         model_save_period: Optional[int] = 5,
         model_history_dir: Optional[str] = 'model_history',
+        torch_dtype: Optional[torch.dtype] = None,
     ) -> None:
+        self._torch_dtype = torch_dtype
         super().__init__(
             varying_parameters=varying_parameters,
             objectives=objectives,
@@ -74,6 +81,28 @@ class AxSingleFidelityGenerator(AxServiceGenerator):
             model_history_dir=model_history_dir
         )
 
+    def _determine_torch_device(self) -> None:
+        """Determine the torch device and, if not given, the data type."""
+        super()._determine_torch_device()
+        # Single precision is sufficient (and much faster) on GPU.
+        if self._torch_dtype is None:
+            if self.torch_device == 'cuda':
+                self._torch_dtype = torch.float
+            else:
+                self._torch_dtype = torch.double
+
+    def _ask(
+        self,
+        trials: List[Trial]
+    ) -> List[Trial]:
+        """Fill in the parameter values of the requested trials."""
+        # The torch backend flags are not inherited by the generator worker,
+        # so they are set here.
+        if self.torch_device == 'cuda' and self._torch_dtype == torch.float:
+            torch.backends.cuda.matmul.allow_tf32 = True
+            torch.backends.cudnn.allow_tf32 = True
+        return super()._ask(trials)
+
     def _create_ax_client(self):
         """Create single-fidelity Ax client."""
         # Create parameter list.
@@ -108,7 +137,7 @@ class AxSingleFidelityGenerator(AxServiceGenerator):
                 model=Models.GPEI,
                 num_trials=-1,
                 model_kwargs={
-                    'torch_dtype': torch.double,
+                    'torch_dtype': self._torch_dtype,
                     'torch_device': torch.device(self.torch_device)
                 }
             )
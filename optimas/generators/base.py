@@ -198,8 +198,10 @@ class Generator():
             The libEnsemble history array.
         """
         # Keep only evaluations where the simulation finished successfully.
-        history = history[history['sim_ended']]
+        if not history['sim_ended'].all():
+            history = history[history['sim_ended']]
         n_sims = len(history)
+        evaluated_parameters = self._objectives + self._analyzed_parameters
         trials = []
         for i in range(n_sims):
             trial = Trial(
@@ -212,7 +214,7 @@ class Generator():
                     Evaluation(
                         parameter=par,
                         value=history[par.name][i]
-                    ) for par in self._objectives + self._analyzed_parameters
+                    ) for par in evaluated_parameters
                 ],
                 custom_parameters=self._custom_trial_parameters
             )
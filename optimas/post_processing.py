@@ -21,9 +21,11 @@ class PostProcOptimization(object):
         """
         # Find the `npy` file that contains the results
         if os.path.isdir(path):
-            output_files = [filename for filename in os.listdir(path)
-                            if filename.startswith('libE_history_for_run_')
-                            and filename.endswith('.npy')]
+            with os.scandir(path) as it:
+                output_files = [
+                    entry.path for entry in it
+                    if entry.name.startswith('libE_history_for_run_')
+                    and entry.name.endswith('.npy')]
             if len(output_files) == 0:
                 raise RuntimeError(
                     'The specified path does not contain any `.npy` file.')
@@ -38,20 +40,43 @@ class PostProcOptimization(object):
         else:
             raise RuntimeError(
                 'The path should either point to a folder or a `.npy` file.')
+        self._history_file = output_file
 
-        # Load the file as a pandas DataFrame
-        x = np.load(os.path.join(path, output_file))
+        # Load the history as a pandas DataFrame
+        self.reload()
+
+    def reload(self):
+        """
+        Reload the history file from disk.
+
+        Call this method to take into account new results that were
+        written to the history file after this object was created
+        (e.g., while the optimization is still running).
+        """
+        x = np.load(self._history_file)
         d = {label: x[label].flatten() for label in x.dtype.names
              if label not in ['x', 'x_on_cube']}
-        self.df = pd.DataFrame(d)
 
-        # Only keep the simulations that finished properly
-        self.df = self.df[self.df.sim_ended]
+        sim_ended = d['sim_ended']
+        all_ended = sim_ended.all()
 
-        # Make the time relative to the start of the simulation
-        self.df['sim_started_time'] -= self.df['gen_ended_time'].min()
-        self.df['sim_ended_time'] -= self.df['gen_ended_time'].min()
-        self.df['gen_ended_time'] -= self.df['gen_ended_time'].min()
+        # Make the time relative to the start of the simulation (the arrays
+        # are copies, so they can be modified in place)
+        if not sim_ended.any():
+            # No simulation has finished yet, so all rows are discarded below
+            t0 = 0.
+        elif all_ended:
+            t0 = d['gen_ended_time'].min()
+        else:
+            t0 = d['gen_ended_time'][sim_ended].min()
+        for label in ['sim_started_time', 'sim_ended_time', 'gen_ended_time']:
+            d[label] -= t0
+        df = pd.DataFrame(d)
+
+        # Only keep the simulations that finished properly
+        if not all_ended:
+            df = df[sim_ended]
+        self.df = df
 
     def get_df(self):
         """
@@ -72,11 +97,14 @@ class PostProcOptimization(object):
 
         kwargs: optional arguments to pass to `plt.scatter`
         """
+        df = self.df
+        t_end = df['sim_ended_time'].to_numpy()
+        f = df['f'].to_numpy()
         if fidelity_parameter is not None:
-            fidelity = self.df[fidelity_parameter]
+            fidelity = df[fidelity_parameter].to_numpy()
         else:
             fidelity = None
-        plt.scatter(self.df.sim_ended_time, self.df.f, c=fidelity)
+        plt.scatter(t_end, f, c=fidelity)
 
     def get_trace(self, fidelity_parameter=None,
                   min_fidelity=None, t_array=None,
@@ -106,26 +134,17 @@ class PostProcOptimization(object):
         --------
         time, max
         """
-        if fidelity_parameter is not None:
-            assert min_fidelity is not None
-            df = self.df[self.df[fidelity_parameter] >= min_fidelity]
-        else:
-            df = self.df.copy()
-
-        df = df.sort_values('sim_ended_time')
-        t = np.concatenate((np.zeros(1), df.sim_ended_time.values))
-        cummin = np.concatenate((np.zeros(1), df.f.cummin().values))
+        t, cummin = self._get_sorted_trace(fidelity_parameter, min_fidelity)
 
         if t_array is not None:
-            # Interpolate the trace curve on t_array
-            N_interp = len(t_array)
-            N_ref = len(t)
-            cummin_array = np.zeros_like(t_array)
-            i_ref = 0
-            for i_interp in range(N_interp):
-                while i_ref < N_ref-1 and t[i_ref+1] < t_array[i_interp]:
-                    i_ref += 1
-                cummin_array[i_interp] = cummin[i_ref]
+            # Interpolate the trace curve on t_array: for each point, take
+            # the last reference point that is strictly before it
+            # (the indices are shifted and clipped in place, to avoid
+            # allocating temporary arrays)
+            i_ref = np.searchsorted(t, t_array, side='left')
+            i_ref -= 1
+            np.clip(i_ref, 0, len(t)-1, out=i_ref)
+            cummin_array = cummin.take(i_ref)
         else:
             t_array = t
             cummin_array = cummin
@@ -135,6 +154,34 @@ class PostProcOptimization(object):
 
         return t_array, cummin_array
 
+    def _get_sorted_trace(self, fidelity_parameter, min_fidelity):
+        """
+        Return the time-sorted trace of the minimum so far
+        """
+        df = self.df
+        if fidelity_parameter is not None:
+            assert min_fidelity is not None
+            df = df[df[fidelity_parameter] >= min_fidelity]
+
+        sim_ended_time = df['sim_ended_time'].to_numpy()
+        i_sort = np.argsort(sim_ended_time, kind='stable')
+
+        # Fill the sorted values after the initial zero and accumulate
+        # the minimum in place
+        n = len(i_sort)
+        t = np.zeros(n + 1)
+        cummin = np.zeros(n + 1)
+        t[1:] = sim_ended_time[i_sort]
+        cummin[1:] = df['f'].to_numpy()[i_sort]
+        # As with the pandas `cummin`, NaNs (e.g., from failed
+        # evaluations) are skipped by the running minimum but are
+        # kept at their own positions in the trace
+        is_nan = np.isnan(cummin[1:])
+        np.fmin.accumulate(cummin[1:], out=cummin[1:])
+        cummin[1:][is_nan] = np.nan
+
+        return t, cummin
+
     def plot_worker_timeline(self, fidelity_parameter=None):
         """
         Plot the timeline of worker utilization
@@ -147,22 +194,27 @@ class PostProcOptimization(object):
                 be plotted in different colors
         """
         df = self.get_df()
+        starts = df['sim_started_time'].to_numpy()
+        durations = df['sim_ended_time'].to_numpy() - starts
+        workers = df['sim_worker'].to_numpy()
         if fidelity_parameter is not None:
-            min_fidelity = df[fidelity_parameter].min()
-            max_fidelity = df[fidelity_parameter].max()
-
-        for i in range(len(df)):
-            start = df['sim_started_time'].iloc[i]
-            duration = df['sim_ended_time'].iloc[i] - start
-            if fidelity_parameter is not None:
-                fidelity = df[fidelity_parameter].iloc[i]
-                color = plt.cm.viridis(
-                    (fidelity-min_fidelity)/(max_fidelity-min_fidelity))
-            else:
-                color = 'b'
-            plt.barh([str(df['sim_worker'].iloc[i])],
-                     [duration], left=[start],
-                     color=color, edgecolor='k', linewidth=1)
+            fidelity = df[fidelity_parameter].to_numpy()
+            min_fidelity = fidelity.min()
+            max_fidelity = fidelity.max()
+            colors = plt.cm.viridis(
+                (fidelity-min_fidelity)/(max_fidelity-min_fidelity))
+        else:
+            colors = np.full(len(df), 'b')
+
+        # Draw all the evaluations of each worker at once
+        worker_ids = np.unique(workers)
+        for y, worker in enumerate(worker_ids):
+            in_worker = workers == worker
+            plt.broken_barh(
+                list(zip(starts[in_worker], durations[in_worker])),
+                (y-0.4, 0.8), facecolors=colors[in_worker],
+                edgecolor='k', linewidth=1)
+        plt.yticks(range(len(worker_ids)), [str(w) for w in worker_ids])
 
         plt.ylabel('Worker')
         plt.xlabel('Time ')
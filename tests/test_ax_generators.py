@@ -1,4 +1,5 @@
 import numpy as np
+import torch
 from ax.service.ax_client import AxClient, ObjectiveProperties
 from ax.utils.measurement.synthetic_functions import hartmann6
 
@@ -88,6 +89,27 @@ def test_ax_single_fidelity():
     np.save('./tests_output/ax_sf_history' , exploration.history)
 
 
+def test_ax_single_fidelity_torch_dtype():
+    """
+    Test that the GP of the single-fidelity generator runs in double
+    precision by default (on CPU) and follows the given ``torch_dtype``.
+    """
+    var1 = VaryingParameter('x0', -50., 5.)
+    var2 = VaryingParameter('x1', -5., 15.)
+    obj = Objective('f', minimize=False)
+
+    for torch_dtype, expected_dtype in [(None, torch.double),
+                                        (torch.float, torch.float)]:
+        gen = AxSingleFidelityGenerator(
+            varying_parameters=[var1, var2],
+            objectives=[obj],
+            torch_dtype=torch_dtype
+        )
+        assert gen._torch_dtype == expected_dtype
+        gpei_step = gen._ax_client.generation_strategy._steps[1]
+        assert gpei_step.model_kwargs['torch_dtype'] == expected_dtype
+
+
 def test_ax_multi_fidelity():
     """Test that an exploration with a multifidelity generator runs"""
 
@@ -301,6 +323,7 @@ def test_ax_multitask_with_history():
 
 if __name__ == '__main__':
     test_ax_single_fidelity()
+    test_ax_single_fidelity_torch_dtype()
     test_ax_multi_fidelity()
     test_ax_multitask()
     test_ax_client()
@@ -0,0 +1,200 @@
+import os
+
+import matplotlib
+import numpy as np
+import pytest
+
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt  # noqa: E402
+
+from optimas.post_processing import PostProcOptimization
+
+
+def create_history(n_sims, sim_ended=True, f_dtype=float):
+    """Create a minimal libEnsemble history array for testing"""
+    history = np.zeros(
+        n_sims,
+        dtype=[('sim_ended', bool), ('gen_ended_time', float),
+               ('sim_started_time', float), ('sim_ended_time', float),
+               ('sim_worker', int), ('f', f_dtype), ('x', float, (2,))]
+    )
+    history['sim_ended'] = sim_ended
+    history['gen_ended_time'] = 100. + np.arange(n_sims)
+    history['sim_started_time'] = 101. + np.arange(n_sims)
+    history['sim_ended_time'] = 102. + np.arange(n_sims)
+    history['sim_worker'] = np.arange(n_sims) % 2 + 1
+    history['f'] = np.arange(n_sims, 0, -1)
+    return history
+
+
+def save_history(name, history, file_name='libE_history_for_run_test.npy'):
+    """Save a history array in `./tests_output/<name>` and return its path"""
+    exploration_dir = os.path.join('./tests_output', name)
+    os.makedirs(exploration_dir, exist_ok=True)
+    history_file = os.path.join(exploration_dir, file_name)
+    np.save(history_file, history)
+    return history_file
+
+
+def test_reload():
+    """
+    Test that `reload` takes into account the rows that are added to the
+    history file after the post-processing object was created.
+    """
+    history_file = save_history(
+        'test_post_processing_reload', create_history(3))
+
+    pp = PostProcOptimization(os.path.dirname(history_file))
+    assert len(pp.get_df()) == 3
+    t, cummin = pp.get_trace()
+    np.testing.assert_array_equal(t, [0., 2., 3., 4.])
+    np.testing.assert_array_equal(cummin, [0., 3., 2., 1.])
+
+    # Append new rows and reload.
+    save_history('test_post_processing_reload', create_history(5))
+    pp.reload()
+    assert len(pp.get_df()) == 5
+    t, cummin = pp.get_trace()
+    np.testing.assert_array_equal(t, [0., 2., 3., 4., 5., 6.])
+    np.testing.assert_array_equal(cummin, [0., 5., 4., 3., 2., 1.])
+
+
+def test_relative_path_to_file():
+    """Test loading a history file given by its relative path."""
+    history_file = save_history(
+        'test_post_processing_relative_path', create_history(4))
+
+    pp = PostProcOptimization(history_file)
+    assert len(pp.get_df()) == 4
+
+
+def test_no_finished_simulations():
+    """Test loading a history in which no simulation has finished yet."""
+    history_file = save_history(
+        'test_post_processing_no_finished_sims',
+        create_history(4, sim_ended=False))
+
+    pp = PostProcOptimization(history_file)
+    assert len(pp.get_df()) == 0
+    t, cummin = pp.get_trace()
+    np.testing.assert_array_equal(t, [0.])
+    np.testing.assert_array_equal(cummin, [0.])
+
+
+def test_float32_objective():
+    """Test computing the trace of an objective that is not float64."""
+    history_file = save_history(
+        'test_post_processing_float32', create_history(3, f_dtype=np.float32))
+
+    pp = PostProcOptimization(history_file)
+    t, cummin = pp.get_trace()
+    np.testing.assert_array_equal(t, [0., 2., 3., 4.])
+    np.testing.assert_array_equal(cummin, [0., 3., 2., 1.])
+
+
+def test_multiple_history_files():
+    """Test that a folder with several history files is rejected."""
+    for i in range(2):
+        history_file = save_history(
+            'test_post_processing_multiple_files', create_history(3),
+            file_name='libE_history_for_run_{}.npy'.format(i))
+
+    with pytest.raises(RuntimeError):
+        PostProcOptimization(os.path.dirname(history_file))
+
+
+def test_trace_follows_df():
+    """
+    Test that the trace reflects in-place modifications and reassignments
+    of the DataFrame, and that modifying a returned trace has no effect.
+    """
+    history_file = save_history(
+        'test_post_processing_trace_follows_df', create_history(3))
+
+    pp = PostProcOptimization(history_file)
+    t, cummin = pp.get_trace()
+    t *= 0
+    cummin *= 0
+    t, cummin = pp.get_trace()
+    np.testing.assert_array_equal(t, [0., 2., 3., 4.])
+    np.testing.assert_array_equal(cummin, [0., 3., 2., 1.])
+
+    # Modify the DataFrame in place.
+    pp.get_df()['f'] *= -1
+    t, cummin = pp.get_trace()
+    np.testing.assert_array_equal(cummin, [0., -3., -3., -3.])
+
+    # Replace the DataFrame with a filtered one.
+    pp.df = pp.df[pp.df['sim_worker'] == 1]
+    t, cummin = pp.get_trace()
+    np.testing.assert_array_equal(t, [0., 2., 4.])
+    np.testing.assert_array_equal(cummin, [0., -3., -3.])
+
+
+def test_trace_on_t_array():
+    """
+    Test interpolating the trace on given times. A reference point is only
+    used once the time is strictly after it.
+    """
+    history_file = save_history(
+        'test_post_processing_trace_on_t_array', create_history(3))
+
+    pp = PostProcOptimization(history_file)
+    # The reference trace is t = [0, 2, 3, 4], cummin = [0, 3, 2, 1]. The
+    # times are before the first point, equal to reference times, between
+    # them and after the last point.
+    t_array = np.array([-1., 0., 2., 2.5, 3., 4., 10.])
+    t, cummin = pp.get_trace(t_array=t_array)
+    np.testing.assert_array_equal(t, t_array)
+    np.testing.assert_array_equal(cummin, [0., 0., 0., 3., 3., 2., 1.])
+
+    # A list of times is also accepted.
+    t, cummin = pp.get_trace(t_array=list(t_array))
+    np.testing.assert_array_equal(cummin, [0., 0., 0., 3., 3., 2., 1.])
+
+
+def test_plot_worker_timeline():
+    """
+    Test that the worker timeline can be plotted, with and without
+    coloring by fidelity.
+    """
+    history_file = save_history(
+        'test_post_processing_worker_timeline', create_history(5))
+
+    pp = PostProcOptimization(history_file)
+    pp.df['res'] = np.linspace(1., 8., len(pp.df))
+    for fidelity_parameter in [None, 'res']:
+        plt.figure()
+        pp.plot_worker_timeline(fidelity_parameter=fidelity_parameter)
+
+        # One collection of bars per worker, labeled by worker ID.
+        ax = plt.gca()
+        assert len(ax.collections) == 2
+        assert [label.get_text() for label in ax.get_yticklabels()] == [
+            '1', '2']
+        plt.close()
+
+
+def test_trace_with_nan():
+    """Test that failed evaluations (NaN) are kept as NaN in the trace."""
+    history = create_history(4)
+    history['f'] = [3., np.nan, 1., 2.]
+    history_file = save_history('test_post_processing_trace_with_nan', history)
+
+    pp = PostProcOptimization(history_file)
+    t, cummin = pp.get_trace()
+    np.testing.assert_array_equal(cummin, [0., 3., np.nan, 1., 1.])
+    np.testing.assert_array_equal(
+        cummin[1:], pp.get_df()['f'].cummin().to_numpy())
+
+
+if __name__ == '__main__':
+    test_reload()
+    test_relative_path_to_file()
+    test_no_finished_simulations()
+    test_float32_objective()
+    test_multiple_history_files()
+    test_trace_follows_df()
+    test_trace_on_t_array()
+    test_plot_worker_timeline()
+    test_trace_with_nan()